@@ -11,11 +11,22 @@
 import struct
 import sys
 import os
+import mmap
 import re
 import json
+from array import array
 from datetime import datetime
 from pathlib import Path
 
+# Patterns used on every scanned message/block, compiled once up front
+_DATE_RE_STD = re.compile(r'Date\s*[:-]\s*(\d{1,2}/\d{1,2}/\d{2})\s+(\d{1,2}:\d{2}:\d{2})\s+([AP]M)')
+_DATE_RE_ALT = re.compile(r'Date\s*->\s*(\d{1,2}/\d{1,2}/\d{2})\s+(\d{1,2}:\d{2}:\d{2})\s+([AP]M)')
+_NUMCOMMA_RE = re.compile(r'^\d+,')
+
+# Little-endian block pointers and the MSGINFO header, compiled once up front
+_U16 = struct.Struct('<H')
+_MSGINFO_HDR = struct.Struct('<BBHHH')
+
 def read_data2_file(filename):
     """
     Read GBBS Pro DATA2 file and return a dictionary mapping board filenames to board names.
@@ -117,24 +128,23 @@ def read_users_file(filename):
         offset = user_id * record_size
         record = data[offset:offset+record_size]
         
-        # Parse first line: First_name,Last_Name\r
-        first_line_end = record.find(0x0d)
-        if first_line_end <= 0:
+        # Split out the first three \r-terminated lines in a single scan of the record;
+        # the last part is whatever follows the third \r (or the unterminated remainder)
+        lines = record.split(b'\r', 3)
+        
+        # First line: First_name,Last_Name\r
+        if len(lines) < 2 or not lines[0]:
             continue
         
-        # Parse second line: Full_name\r
-        second_start = first_line_end + 1
-        second_line_end = record.find(0x0d, second_start)
-        if second_line_end <= 0:
+        # Second line: Full_name\r
+        if len(lines) < 3:
             continue
         
-        full_name = record[second_start:second_line_end].decode('ascii', errors='replace').strip()
+        full_name = lines[1].decode('ascii', errors='replace').strip()
         
-        # Parse third line: City,State\r
-        third_start = second_line_end + 1
-        third_line_end = record.find(0x0d, third_start)
-        if third_line_end > 0:
-            city_state = record[third_start:third_line_end].decode('ascii', errors='replace').strip()
+        # Third line: City,State\r
+        if len(lines) == 4:
+            city_state = lines[2].decode('ascii', errors='replace').strip()
         else:
             city_state = ""
         
@@ -150,26 +160,144 @@ def detect_format(data):
     """Detect database format from header byte 0."""
     return 'email' if data[0] == 0x04 else 'bulletin'
 
+# Translation tables for _expand_7bit(): _CR_TO_LF turns carriage returns (the Apple II
+# line ending) into line feeds, _LOW7 strips the high bit of a byte and does the same
+# CR -> LF mapping, and _MSB_BITS[k] moves the high bit of the k-th byte of a group
+# down to bit k.
+_CR_TO_LF = bytes(0x0A if b == 0x0D else b for b in range(256))
+_LOW7 = bytes(b & 0x7F for b in range(256)).translate(_CR_TO_LF)
+_MSB_BITS = [bytes((b >> 7) << k for b in range(256)) for k in range(7)]
+
+def _expand_7bit(packed, record_count, record_size, group_count):
+    """
+    Expand 7-bit packed groups into a bytearray of 8-bit characters.
+
+    The input holds record_count records spaced record_size bytes apart, each starting
+    with group_count 7-byte groups. Every 7 bytes hold 8 characters: the low 7 bits of
+    each byte are characters 1-7, and the high bits of the 7 bytes (first byte = lowest
+    bit) make up character 8. Instead of walking the groups a byte at a time, each byte
+    "column" is pulled out of every record with one extended slice and run through
+    bytes.translate(), so the work happens in a handful of C-level operations no matter
+    how many records there are. Carriage returns come out as line feeds, so callers can
+    decode the result as-is.
+    """
+    out_size = group_count * 8
+    result = bytearray(record_count * out_size)
+    for g in range(group_count):
+        char8 = 0
+        for k in range(7):
+            column = bytes(packed[g * 7 + k::record_size])
+            result[g * 8 + k::out_size] = column.translate(_LOW7)
+            char8 |= int.from_bytes(column.translate(_MSB_BITS[k]), 'little')
+        result[g * 8 + 7::out_size] = char8.to_bytes(record_count, 'little').translate(_CR_TO_LF)
+    return result
+
 def decode_7bit(compressed_data, stop_at_null=True):
     """Decode 7-bit compressed data to ASCII text."""
-    result = []
-    i = 0
-    while i + 6 < len(compressed_data):
-        bytes_7 = compressed_data[i:i+7]
-        char8 = 0
-        chars = []
-        for b in bytes_7:
-            char8 = (char8 >> 1) | ((b & 0x80) >> 0)
-            chars.append(b & 0x7F)
-        char8 = char8 >> 1
-        chars.append(char8)
-        
-        for c in chars:
-            if stop_at_null and c == 0:
-                return bytes(result).decode('ascii', errors='replace').replace('\r', '\n')
-            result.append(c)
-        i += 7
-    return bytes(result).decode('ascii', errors='replace').replace('\r', '\n')
+    group_count = len(compressed_data) // 7
+    result = _expand_7bit(compressed_data[:group_count * 7], group_count, 7, 1)
+    if stop_at_null:
+        null_pos = result.find(0)
+        if null_pos >= 0:
+            del result[null_pos:]
+    return result.decode('ascii', errors='replace')
+
+def decode_data_blocks(data, data_offset, total_blocks):
+    """
+    Decode the 126 data bytes of every block in the data area in a single pass.
+
+    Returns one string of total_blocks * 144 characters; the text of block N is at
+    [(N - 1) * 144:N * 144]. This is the same as calling decode_7bit(..., stop_at_null=False)
+    on each block, but without paying the per-call overhead thousands of times over.
+    """
+    if total_blocks <= 0:
+        return ''
+    packed = data[data_offset:data_offset + total_blocks * 128]
+    result = _expand_7bit(packed, total_blocks, 128, 18)
+    return result.decode('ascii', errors='replace')
+
+def _parse_date_fast(text):
+    """
+    Parse the usual fixed-width date header without using regex.
+
+    Only the first 'Date' within the first 256 characters is looked at, and only in the
+    exact shape 'Date : MM/DD/YY HH:MM:SS AM' (or 'Date ->...'). Anything else returns
+    None so that parse_date() can fall back to the regex patterns.
+    """
+    head = text[:256]
+    i = head.find('Date')
+    if i < 0:
+        return None
+    
+    j = i + 4
+    while head[j:j+1] == ' ':
+        j += 1
+    if head.startswith('->', j):
+        # The regexes try the ':' form across the whole text before '->', so only
+        # take the shortcut when no other date tag could have matched first
+        if text.find('Date', j) >= 0:
+            return None
+        j += 2
+    elif head[j:j+1] in (':', '-'):
+        j += 1
+    else:
+        return None
+    while head[j:j+1] == ' ':
+        j += 1
+    
+    # MM/DD/YY HH:MM:SS
+    date_part = head[j:j+8]
+    j += 8
+    if head[j:j+1] != ' ':
+        return None
+    while head[j:j+1] == ' ':
+        j += 1
+    time_part = head[j:j+8]
+    j += 8
+    if head[j:j+1] != ' ':
+        return None
+    while head[j:j+1] == ' ':
+        j += 1
+    ampm = head[j:j+2]
+    
+    if (len(date_part) != 8 or date_part[2] != '/' or date_part[5] != '/' or
+            len(time_part) != 8 or time_part[2] != ':' or time_part[5] != ':' or
+            ampm not in ('AM', 'PM')):
+        return None
+    fields = (date_part[0:2], date_part[3:5], date_part[6:8],
+              time_part[0:2], time_part[3:5], time_part[6:8])
+    if not all(field.isdigit() for field in fields):
+        return None
+    month, day, year, hour, minute, second = (int(field) for field in fields)
+    
+    # Same rules as strptime's %y and %I/%p
+    year += 2000 if year <= 68 else 1900
+    if not 1 <= hour <= 12:
+        return None
+    hour %= 12
+    if ampm == 'PM':
+        hour += 12
+    try:
+        return datetime(year, month, day, hour, minute, second)
+    except ValueError:
+        return None
+
+def read_next_pointers(data, data_offset, total_blocks):
+    """
+    Read the next-block pointer (bytes 126-127) of every block in the data area at once.
+
+    Returns an array of unsigned shorts; the pointer of block N is at index N - 1.
+    """
+    if total_blocks <= 0:
+        return array('H')
+    area = data[data_offset:data_offset + total_blocks * 128]
+    pointer_bytes = bytearray(total_blocks * 2)
+    pointer_bytes[0::2] = bytes(area[126::128])
+    pointer_bytes[1::2] = bytes(area[127::128])
+    next_ptrs = array('H', pointer_bytes)
+    if sys.byteorder == 'big':
+        next_ptrs.byteswap()
+    return next_ptrs
 
 def parse_date(text):
     """
@@ -182,8 +310,13 @@ def parse_date(text):
     possible that the two formats here might not cover all implementations of GBBS Pro systems.
     As such, try adding your own format below if you encounter a different one.
     """
+    # Fast path for the common header shape; custom formats fall through to the regexes
+    date = _parse_date_fast(text)
+    if date:
+        return date
+    
     # Try standard format: Date : MM/DD/YY HH:MM:SS AM/PM
-    date_match = re.search(r'Date\s*[:-]\s*(\d{1,2}/\d{1,2}/\d{2})\s+(\d{1,2}:\d{2}:\d{2})\s+([AP]M)', text)
+    date_match = _DATE_RE_STD.search(text)
     if date_match:
         date_str = f"{date_match.group(1)} {date_match.group(2)} {date_match.group(3)}"
         try:
@@ -192,7 +325,7 @@ def parse_date(text):
             pass
     
     # Try alternate format: Date ->MM/DD/YY HH:MM:SS AM/PM
-    date_match = re.search(r'Date\s*->\s*(\d{1,2}/\d{1,2}/\d{2})\s+(\d{1,2}:\d{2}:\d{2})\s+([AP]M)', text)
+    date_match = _DATE_RE_ALT.search(text)
     if date_match:
         date_str = f"{date_match.group(1)} {date_match.group(2)} {date_match.group(3)}"
         try:
@@ -207,16 +340,17 @@ def read_msginfo(data):
     if len(data) < 8:
         return None
     
+    bitmap_blocks, dir_blocks, used_blocks, msg_count, new_msg_num = _MSGINFO_HDR.unpack_from(data, 0)
     return {
-        'bitmap_blocks': data[0],
-        'dir_blocks': data[1],
-        'used_blocks': struct.unpack('<H', data[2:4])[0],
-        'msg_count': struct.unpack('<H', data[4:6])[0],
-        'new_msg_num': struct.unpack('<H', data[6:8])[0],
+        'bitmap_blocks': bitmap_blocks,
+        'dir_blocks': dir_blocks,
+        'used_blocks': used_blocks,
+        'msg_count': msg_count,
+        'new_msg_num': new_msg_num,
         'bitmap_offset': 8,
-        'dir_offset': 8 + (data[0] * 128),
-        'data_offset': 8 + (data[0] * 128) + (data[1] * 128),
-        'max_dir_entries': (data[1] * 128) // 4
+        'dir_offset': 8 + (bitmap_blocks * 128),
+        'data_offset': 8 + (bitmap_blocks * 128) + (dir_blocks * 128),
+        'max_dir_entries': (dir_blocks * 128) // 4
     }
 
 def is_message_start(decoded_text):
@@ -228,25 +362,44 @@ def is_message_start(decoded_text):
     your data file has a different format, you need to add this on the line 3 below since
     this whole area of a message header was customizable by a BBS sysop.
     """
-    lines = decoded_text.split('\n')
-    if len(lines) < 4:
-        return False
-    
     # Line 0: Subject (any text)
     # Line 1: To (number,name format)
     # Line 2: From (number,name format)
     # Line 3: Date line
     
-    # Check line 1 and 2 for "number,text" pattern
-    if not (re.match(r'^\d+,', lines[1]) and re.match(r'^\d+,', lines[2])):
+    # Locate the line breaks instead of splitting the whole block; most blocks fail
+    # these checks, so bail out as early as possible
+    nl1 = decoded_text.find('\n')
+    if nl1 < 0:
+        return False
+    nl2 = decoded_text.find('\n', nl1 + 1)
+    if nl2 < 0:
+        return False
+    nl3 = decoded_text.find('\n', nl2 + 1)
+    if nl3 < 0:
         return False
+    nl4 = decoded_text.find('\n', nl3 + 1)
+    line3 = decoded_text[nl3+1:nl4] if nl4 >= 0 else decoded_text[nl3+1:]
     
     # Check line 3 for Date pattern
-    if not ('Date' in lines[3] and (':' in lines[3] or '->' in lines[3])):
+    if not ('Date' in line3 and (':' in line3 or '->' in line3)):
+        return False
+    
+    # Check line 1 and 2 for "number,text" pattern
+    if not (_NUMCOMMA_RE.match(decoded_text[nl1+1:nl2]) and _NUMCOMMA_RE.match(decoded_text[nl2+1:nl3])):
         return False
     
     return True
 
+def new_block_map(total_blocks):
+    """
+    Create an empty block bitmap: one byte per block number, set to 1 once claimed.
+
+    It is sized to cover every possible 16-bit block pointer, so a bad pointer past the
+    end of the data area can still be looked up and marked like any other block.
+    """
+    return bytearray(max(total_blocks + 1, 0x10000))
+
 def scan_database_bulletin(data):
     """Scan bulletin board format database with priority-based block allocation."""
     msginfo = read_msginfo(data)
@@ -258,19 +411,27 @@ def scan_database_bulletin(data):
     total_blocks = data_area_size // 128
     max_entries = msginfo['max_dir_entries']
     dir_offset = msginfo['dir_offset']
+    decoded_blocks = decode_data_blocks(data, data_offset, total_blocks)
+    next_ptrs = read_next_pointers(data, data_offset, total_blocks)
     
-    used_blocks = set()  # Track all blocks claimed by any message
+    # Non-null byte count of every block's data area, so the deleted/orphan scans can
+    # skip empty blocks without looking at them again
+    block_nonnull = [126 - bytes(data[offset:offset+126]).count(0)
+                     for offset in range(data_offset, data_offset + total_blocks * 128, 128)]
+    
+    used_map = new_block_map(total_blocks)  # Track all blocks claimed by any message
     
     # PHASE 1: Extract active messages from directory
     active_messages = []
+    active_all_blocks = set()  # Track all blocks used by active messages
+    has_any_date = False  # Any active message with a standard date header
+    data_len = len(data)
+    unpack_u16 = _U16.unpack_from
     for entry_num in range(max_entries):
         entry_offset = dir_offset + (entry_num * 4)
-        if entry_offset + 4 > len(data):
+        if entry_offset + 4 > data_len:
             break
-        entry = data[entry_offset:entry_offset+4]
-        if len(entry) < 4:
-            break
-        block_num = struct.unpack('<H', entry[2:4])[0]
+        block_num = unpack_u16(data, entry_offset + 2)[0]
         
         if block_num == 0:
             continue
@@ -280,10 +441,14 @@ def scan_database_bulletin(data):
             continue
         
         # Extract message and mark all blocks in chain as used
-        message, chain_blocks = follow_chain_with_tracking(data, block_num, total_blocks, used_blocks, data_offset)
-        used_blocks.update(chain_blocks)
+        message, chain_blocks = follow_chain_with_tracking(data, block_num, total_blocks, used_map, data_offset, decoded_blocks, next_ptrs)
+        for b in chain_blocks:
+            used_map[b] = 1
+        active_all_blocks.update(chain_blocks)
         
         date = parse_date(message)
+        if date:
+            has_any_date = True
         active_messages.append({
             'entry': entry_num,
             'block': block_num,
@@ -294,29 +459,10 @@ def scan_database_bulletin(data):
     # PHASE 2: Find deleted messages (message start pattern in unused blocks)
     deleted_messages = []
     deleted_all_blocks = set()  # Track all blocks used by deleted messages
-    all_blocks = set(range(1, total_blocks + 1))
-    unused_blocks = all_blocks - used_blocks
+    candidates = [b for b in range(1, total_blocks + 1) if not used_map[b] and block_nonnull[b - 1] >= 10]
     
-    for block_num in sorted(unused_blocks):
-        if block_num in used_blocks:
-            continue
-        
-        block_offset = data_offset + (block_num - 1) * 128
-        if block_offset + 128 > len(data):
-            continue
-        block_data = data[block_offset:block_offset+126]
-        
-        non_null_count = sum(1 for b in block_data if b != 0)
-        if non_null_count < 10:
-            continue
-        
-        decoded = decode_7bit(block_data)
-        if not is_message_start(decoded):
-            continue
-        
-        # Found deleted message start - extract and mark blocks
-        message, chain_blocks = follow_chain_with_tracking(data, block_num, total_blocks, used_blocks, data_offset)
-        used_blocks.update(chain_blocks)
+    # Follow chains from blocks that look like a message start
+    for block_num, message, chain_blocks in scan_candidate_blocks(data, candidates, total_blocks, used_map, data_offset, decoded_blocks, next_ptrs, find_starts=True):
         deleted_all_blocks.update(chain_blocks)
         
         date = parse_date(message)
@@ -328,25 +474,11 @@ def scan_database_bulletin(data):
     
     # PHASE 3: Extract orphaned blocks (remaining unused blocks with data)
     orphaned_messages = []
-    unused_blocks = all_blocks - used_blocks
+    # Claims only grow, so the Phase 2 candidates still unclaimed are exactly this phase's
+    candidates = [b for b in candidates if not used_map[b]]
     
-    for block_num in sorted(unused_blocks):
-        if block_num in used_blocks:
-            continue
-        
-        block_offset = data_offset + (block_num - 1) * 128
-        if block_offset + 128 > len(data):
-            continue
-        block_data = data[block_offset:block_offset+126]
-        
-        non_null_count = sum(1 for b in block_data if b != 0)
-        if non_null_count < 10:
-            continue
-        
-        # Extract orphaned block and follow chain
-        message, chain_blocks = follow_chain_with_tracking(data, block_num, total_blocks, used_blocks, data_offset)
-        used_blocks.update(chain_blocks)
-        
+    # Extract each orphaned block and follow its chain
+    for block_num, message, chain_blocks in scan_candidate_blocks(data, candidates, total_blocks, used_map, data_offset, decoded_blocks, next_ptrs, find_starts=False):
         orphaned_messages.append({
             'block': block_num,
             'message': message
@@ -354,25 +486,6 @@ def scan_database_bulletin(data):
     
     deleted_messages.sort(key=lambda x: x['date'] if x['date'] else datetime.min)
     
-    # Calculate active blocks (all blocks used by active messages)
-    active_all_blocks = set()
-    for msg in active_messages:
-        # Add header block
-        active_all_blocks.add(msg['block'])
-        # Follow chain to get all blocks
-        current = msg['block']
-        visited = set([current])
-        block_offset = data_offset + (current - 1) * 128
-        if block_offset + 128 <= len(data):
-            next_block = struct.unpack('<H', data[block_offset+126:block_offset+128])[0]
-            while next_block != 0 and next_block not in visited:
-                active_all_blocks.add(next_block)
-                visited.add(next_block)
-                block_offset = data_offset + (next_block - 1) * 128
-                if block_offset + 128 > len(data):
-                    break
-                next_block = struct.unpack('<H', data[block_offset+126:block_offset+128])[0]
-    
     return {
         'format': 'bulletin',
         'msginfo': msginfo,
@@ -384,7 +497,8 @@ def scan_database_bulletin(data):
         'orphaned_blocks': set(msg['block'] for msg in orphaned_messages),
         'active_messages': active_messages,
         'deleted_messages': deleted_messages,
-        'orphaned_messages': orphaned_messages
+        'orphaned_messages': orphaned_messages,
+        'has_any_date': has_any_date
     }
 
 def scan_database_email(data, users=None):
@@ -403,9 +517,13 @@ def scan_database_email(data, users=None):
     total_blocks = data_area_size // 128
     max_entries = msginfo['max_dir_entries']
     dir_offset = msginfo['dir_offset']
+    decoded_blocks = decode_data_blocks(data, data_offset, total_blocks)
+    next_ptrs = read_next_pointers(data, data_offset, total_blocks)
+    no_stop_map = bytes(new_block_map(total_blocks))
     
     all_messages = []
     used_blocks = set()
+    has_any_date = False  # Any message with a standard date header
     
     # Each directory entry corresponds to a user ID
     for user_id in range(max_entries):
@@ -413,11 +531,7 @@ def scan_database_email(data, users=None):
         if entry_offset + 4 > len(data):
             break
         
-        entry = data[entry_offset:entry_offset+4]
-        if len(entry) < 4:
-            break
-        
-        block_num = struct.unpack('<H', entry[2:4])[0]
+        block_num = _U16.unpack_from(data, entry_offset + 2)[0]
         if block_num == 0:
             continue
         
@@ -425,18 +539,26 @@ def scan_database_email(data, users=None):
         user_info = users.get(user_id) if users else None
         
         # Follow chain for this user
-        chain_text, chain_blocks = follow_chain_with_tracking(data, block_num, total_blocks, set(), data_offset)
+        chain_text, chain_blocks = follow_chain_with_tracking(data, block_num, total_blocks, no_stop_map, data_offset, decoded_blocks, next_ptrs)
         used_blocks.update(chain_blocks)
         
-        # Split on EOT (0x04) to get individual messages
-        messages = chain_text.split('\x04')
-        
-        for msg in messages:
-            msg = msg.replace('\x00', '').strip()
+        # Walk the EOT (0x04) separators to get individual messages, slicing out each
+        # one in place instead of building the full split() list. The chain text is
+        # already cut off at its first null, so only whitespace needs stripping.
+        pos = 0
+        text_len = len(chain_text)
+        while pos <= text_len:
+            eot = chain_text.find('\x04', pos)
+            if eot < 0:
+                eot = text_len
+            msg = chain_text[pos:eot].strip()
+            pos = eot + 1
             if len(msg) < 20:
                 continue
             
             date = parse_date(msg)
+            if date:
+                has_any_date = True
             all_messages.append({
                 'user_id': user_id,
                 'user_info': user_info,
@@ -456,7 +578,8 @@ def scan_database_email(data, users=None):
         'orphaned_blocks': set(),
         'active_messages': all_messages,
         'deleted_messages': [],
-        'orphaned_messages': []
+        'orphaned_messages': [],
+        'has_any_date': has_any_date
     }
 
 def scan_database(data, users=None):
@@ -467,8 +590,46 @@ def scan_database(data, users=None):
     else:
         return scan_database_bulletin(data)
 
-def follow_chain_with_tracking(data, start_block, total_blocks, stop_blocks, data_offset):
-    """Follow block chain, stopping at already-used blocks.
+def _looks_like_message_start(decoded_blocks, block_num):
+    """Check if a block's text (up to the first null) is a message start."""
+    decoded = decoded_blocks[(block_num - 1) * 144:block_num * 144]
+    null_pos = decoded.find('\x00')
+    if null_pos >= 0:
+        decoded = decoded[:null_pos]
+    return is_message_start(decoded)
+
+def scan_candidate_blocks(data, candidates, total_blocks, used_map, data_offset, decoded_blocks, next_ptrs, find_starts):
+    """
+    Follow the chain from each candidate block in order, claiming its blocks in used_map.
+
+    Candidates already claimed by an earlier chain are skipped. With find_starts, only
+    blocks that look like a message start are followed (deleted messages), otherwise
+    every candidate is (orphaned blocks).
+
+    Returns list of tuples: (block_num, message_text, set_of_blocks_used)
+    """
+    found = []
+    looks_like_start = _looks_like_message_start
+    follow_chain = follow_chain_with_tracking
+    found_append = found.append
+    for block_num in candidates:
+        if used_map[block_num]:
+            continue
+        if find_starts and not looks_like_start(decoded_blocks, block_num):
+            continue
+        message, chain_blocks = follow_chain(data, block_num, total_blocks, used_map, data_offset, decoded_blocks, next_ptrs)
+        for b in chain_blocks:
+            used_map[b] = 1
+        found_append((block_num, message, chain_blocks))
+    return found
+
+def follow_chain_with_tracking(data, start_block, total_blocks, stop_map, data_offset, decoded_blocks, next_ptrs):
+    """Follow block chain, stopping at already-used blocks (those set in stop_map,
+    a bitmap from new_block_map).
+    
+    Block text is taken from decoded_blocks (from decode_data_blocks) and next pointers
+    from next_ptrs (from read_next_pointers) instead of decoding and reading each block
+    again.
     
     Returns tuple: (message_text, set_of_blocks_used)
     """
@@ -478,31 +639,36 @@ def follow_chain_with_tracking(data, start_block, total_blocks, stop_blocks, dat
     blocks_used = set()
     first_block = True
     
+    # Bind what the loop uses on every block to locals once
+    data_len = len(data)
+    visited_add = visited.add
+    blocks_used_add = blocks_used.add
+    parts_append = message_parts.append
+    is_start = is_message_start
+    
     while current_block != 0 and current_block not in visited:
         # Stop if this block is already claimed by higher priority
-        if current_block in stop_blocks:
+        if stop_map[current_block]:
             break
         
-        visited.add(current_block)
-        blocks_used.add(current_block)
+        visited_add(current_block)
+        blocks_used_add(current_block)
         
         block_offset = data_offset + (current_block - 1) * 128
-        if block_offset + 128 > len(data) or current_block > total_blocks:
+        if block_offset + 128 > data_len or current_block > total_blocks:
             break
         
-        block_data = data[block_offset:block_offset+126]
-        next_block = struct.unpack('<H', data[block_offset+126:block_offset+128])[0]
+        next_block = next_ptrs[current_block - 1]
         
-        decoded = decode_7bit(block_data, stop_at_null=False)
+        decoded = decoded_blocks[(current_block - 1) * 144:current_block * 144]
         
         # If continuation block has message start pattern, stop before it
-        if not first_block and is_message_start(decoded):
-            break
-        
         if not first_block:
+            if is_start(decoded):
+                break
             decoded = decoded.lstrip('\x00')
         
-        message_parts.append(decoded)
+        parts_append(decoded)
         first_block = False
         
         if next_block == 0:
@@ -511,12 +677,11 @@ def follow_chain_with_tracking(data, start_block, total_blocks, stop_blocks, dat
         # Handle self-referencing pointer
         if next_block == current_block:
             next_sequential = current_block + 1
-            if next_sequential <= total_blocks and next_sequential not in stop_blocks:
+            if next_sequential <= total_blocks and not stop_map[next_sequential]:
                 next_seq_offset = data_offset + (next_sequential - 1) * 128
-                if next_seq_offset + 128 <= len(data):
-                    next_seq_data = data[next_seq_offset:next_seq_offset+126]
-                    next_seq_decoded = decode_7bit(next_seq_data, stop_at_null=False)
-                    if not is_message_start(next_seq_decoded) and len(next_seq_decoded.strip()) > 10:
+                if next_seq_offset + 128 <= data_len:
+                    next_seq_decoded = decoded_blocks[(next_sequential - 1) * 144:next_sequential * 144]
+                    if not is_start(next_seq_decoded) and len(next_seq_decoded.strip()) > 10:
                         current_block = next_sequential
                         continue
             break
@@ -533,11 +698,24 @@ def follow_chain_with_tracking(data, start_block, total_blocks, stop_blocks, dat
     
     return full_message, blocks_used
 
+def read_database_file(filename):
+    """
+    Open a message database file for scanning.
+
+    The file is memory-mapped rather than read, so slicing the returned memoryview gives
+    zero-copy views. Files that can't be mapped (pipes such as /dev/stdin, empty files)
+    are read into memory instead.
+    """
+    with open(filename, 'rb') as f:
+        try:
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except (ValueError, OSError):
+            return f.read()
+
 def cmd_analyze(filename, users_file=None, use_json=False):
     """Display database statistics and block map."""
     try:
-        with open(filename, 'rb') as f:
-            data = f.read()
+        data = read_database_file(filename)
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found")
         sys.exit(1)
@@ -957,11 +1135,49 @@ def build_analysis_json(result, filename, data_len):
     return info
 
 
+def write_output_file(path, text, timestamp=None, force=False):
+    """
+    Write an extracted file and optionally set its modification time.
+
+    The file is opened once as a raw descriptor: the encoded text is written and the
+    timestamp applied through the same descriptor, instead of going through a buffered
+    text file and then looking the path up again for os.utime(). Without force, the
+    file is created exclusively, so an existing file is never overwritten; that raises
+    FileExistsError for the caller to report.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+    flags |= os.O_TRUNC if force else os.O_EXCL
+    if os.linesep != '\n':
+        text = text.replace('\n', os.linesep)
+    buf = memoryview(text.encode('utf-8', errors='replace'))
+    fd = os.open(path, flags, 0o666)
+    try:
+        while buf:
+            buf = buf[os.write(fd, buf):]
+        if timestamp is not None and os.utime in os.supports_fd:
+            os.utime(fd, (timestamp, timestamp))
+            timestamp = None
+    finally:
+        os.close(fd)
+    if timestamp is not None:
+        os.utime(path, (timestamp, timestamp))
+
+
+def report_existing_files(existing_files):
+    """Print the files that would have been overwritten and exit."""
+    print(f"Error: The following files already exist:")
+    for f in existing_files[:10]:  # Show first 10
+        print(f"  {f}")
+    if len(existing_files) > 10:
+        print(f"  ... and {len(existing_files) - 10} more")
+    print(f"\nUse --force to overwrite existing files")
+    sys.exit(1)
+
+
 def cmd_extract(filename, active=False, deleted=False, orphaned=False, output_dir=None, users_file=None, data2_file=None, force=False, pretty=False, use_json=False):
     """Extract messages from database."""
     try:
-        with open(filename, 'rb') as f:
-            data = f.read()
+        data = read_database_file(filename)
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found")
         sys.exit(1)
@@ -985,8 +1201,7 @@ def cmd_extract(filename, active=False, deleted=False, orphaned=False, output_di
     fmt = result['format']
     
     # Check if any messages have dates (indicates standard format)
-    has_dates = any(msg.get('date') for msg in result['active_messages'])
-    if not has_dates and result['active_messages']:
+    if not result['has_any_date'] and result['active_messages']:
         print(f"Warning: No standard date headers found in '{filename}'")
         print(f"This file may use a non-standard format. Please report this for tool enhancement.")
         print()
@@ -998,47 +1213,44 @@ def cmd_extract(filename, active=False, deleted=False, orphaned=False, output_di
     if output_dir:
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         
-        # Check for existing files if not forcing
+        # Check for existing files if not forcing; list the directory once rather than
+        # stat()ing every candidate filename. Names are compared case-insensitively, and
+        # a name that only matches in a different case is left to the filesystem to
+        # decide (it is a conflict on case-insensitive filesystems such as macOS/Windows)
         if not force:
-            existing_files = []
+            with os.scandir(output_dir) as entries:
+                existing = {entry.name for entry in entries}
+            existing_folded = {name.casefold() for name in existing}
             
+            candidates = []
             if use_json:
                 # JSON mode writes a single file
-                json_path = Path(output_dir) / (Path(filename).stem + '.json')
-                if json_path.exists():
-                    existing_files.append(str(json_path))
+                candidates.append(Path(filename).stem + '.json')
             else:
                 if active:
-                    for i in range(1, len(result['active_messages']) + 1):
-                        filename_out = Path(output_dir) / f"Msg-{i:04d}.txt"
-                        if filename_out.exists():
-                            existing_files.append(str(filename_out))
+                    candidates.extend(f"Msg-{i:04d}.txt" for i in range(1, len(result['active_messages']) + 1))
                 
                 if deleted:
-                    for i in range(1, len(result['deleted_messages']) + 1):
-                        filename_out = Path(output_dir) / f"Deleted-{i:04d}.txt"
-                        if filename_out.exists():
-                            existing_files.append(str(filename_out))
+                    candidates.extend(f"Deleted-{i:04d}.txt" for i in range(1, len(result['deleted_messages']) + 1))
                 
                 if orphaned:
-                    for msg in result['orphaned_messages']:
-                        filename_out = Path(output_dir) / f"Orphan-{msg['block']:04d}.txt"
-                        if filename_out.exists():
-                            existing_files.append(str(filename_out))
+                    candidates.extend(f"Orphan-{msg['block']:04d}.txt" for msg in result['orphaned_messages'])
             
+            existing_files = [str(Path(output_dir) / name) for name in candidates
+                              if name.casefold() in existing_folded
+                              and (name in existing or (Path(output_dir) / name).exists())]
             if existing_files:
-                print(f"Error: The following files already exist:")
-                for f in existing_files[:10]:  # Show first 10
-                    print(f"  {f}")
-                if len(existing_files) > 10:
-                    print(f"  ... and {len(existing_files) - 10} more")
-                print(f"\nUse --force to overwrite existing files")
-                sys.exit(1)
-    if not (active or deleted or orphaned):
-        active = True
+                report_existing_files(existing_files)
     
-    if output_dir:
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
+    # Files that turn up between the check above and writing them are not overwritten
+    # either; they are collected and reported the same way once everything else is written
+    conflicts = []
+    
+    def write_file(path, text, timestamp=None):
+        try:
+            write_output_file(path, text, timestamp, force)
+        except FileExistsError:
+            conflicts.append(str(path))
     
     # Get board name if available
     board_name = None
@@ -1090,8 +1302,9 @@ def cmd_extract(filename, active=False, deleted=False, orphaned=False, output_di
         
         if output_dir:
             json_path = Path(output_dir) / (Path(filename).stem + '.json')
-            with open(json_path, 'w') as f:
-                f.write(json_str)
+            write_file(json_path, json_str)
+            if conflicts:
+                report_existing_files(conflicts)
         else:
             print(json_str)
         return
@@ -1120,11 +1333,8 @@ def cmd_extract(filename, active=False, deleted=False, orphaned=False, output_di
             
             if output_dir:
                 filename_out = Path(output_dir) / f"Msg-{i:04d}.txt"
-                with open(filename_out, 'w') as f:
-                    f.write(message_text)
-                if msg.get('date'):
-                    timestamp = msg['date'].timestamp()
-                    os.utime(filename_out, (timestamp, timestamp))
+                timestamp = msg['date'].timestamp() if msg.get('date') else None
+                write_file(filename_out, message_text, timestamp)
             else:
                 print(f"\n{'='*60}")
                 if fmt == 'bulletin':
@@ -1160,11 +1370,8 @@ def cmd_extract(filename, active=False, deleted=False, orphaned=False, output_di
             
             if output_dir:
                 filename_out = Path(output_dir) / f"Deleted-{i:04d}.txt"
-                with open(filename_out, 'w') as f:
-                    f.write(message_text)
-                if msg.get('date'):
-                    timestamp = msg['date'].timestamp()
-                    os.utime(filename_out, (timestamp, timestamp))
+                timestamp = msg['date'].timestamp() if msg.get('date') else None
+                write_file(filename_out, message_text, timestamp)
             else:
                 print(f"\n{'='*60}")
                 header = f"Deleted Message {i} (Block {msg['block']})"
@@ -1186,8 +1393,7 @@ def cmd_extract(filename, active=False, deleted=False, orphaned=False, output_di
         for msg in result['orphaned_messages']:
             if output_dir:
                 filename_out = Path(output_dir) / f"Orphan-{msg['block']:04d}.txt"
-                with open(filename_out, 'w') as f:
-                    f.write(msg['message'])
+                write_file(filename_out, msg['message'])
             else:
                 print(f"\n{'='*60}")
                 header = f"Orphaned Block {msg['block']}"
@@ -1196,6 +1402,9 @@ def cmd_extract(filename, active=False, deleted=False, orphaned=False, output_di
                 print(header)
                 print('='*60)
                 print(msg['message'])
+    
+    if conflicts:
+        report_existing_files(conflicts)
 
 def main():
     if len(sys.argv) < 2 or '--help' in sys.argv: